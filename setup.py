@@ -24,7 +24,7 @@ setup(
     install_requires=[
         'pyyaml',
         'pillow',
-        'graphviz',
+        'graphviz>=0.18',  # graphviz.quoting is used for DOT edge emission
         ],
     license='GPLv3',
     keywords='cable connector hardware harness wiring wiring-diagram wiring-harness',
@@ -34,12 +34,13 @@ setup(
     entry_points={
         'console_scripts': ['wireviz=wireviz.wireviz:main'],
         },
+    python_requires='>=3.10',
     classifiers=[
         'Development Status :: 4 - Beta',
         'Environment :: Console',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Topic :: Utilities',
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         ],
@@ -4,7 +4,7 @@ from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field, InitVar
 from pathlib import Path
 
-from wireviz.wv_helper import int2tuple, aspect_ratio
+from wireviz.wv_helper import int2tuple, aspect_ratio, awg_equiv, mm2_equiv
 from wireviz.wv_colors import Color, Colors, ColorMode, ColorScheme, COLOR_CODES
 
 
@@ -28,11 +28,11 @@ OneOrMoreWires = Union[Wire, Tuple[Wire, ...]] # One or a tuple of wires
 
 # Metadata can contain whatever is needed by the HTML generation/template.
 MetadataKeys = PlainText  # Literal['title', 'description', 'notes', ...]
-class Metadata(dict):
-    pass
+# Plain alias instead of an empty dict subclass; exact dicts take CPython's fast lookup paths.
+Metadata = dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Options:
     fontname: PlainText = 'arial'
     bgcolor: Color = 'WH'
@@ -44,23 +44,19 @@ class Options:
     mini_bom_mode: bool = True
 
     def __post_init__(self):
-        if not self.bgcolor_node:
-            self.bgcolor_node = self.bgcolor
-        if not self.bgcolor_connector:
-            self.bgcolor_connector = self.bgcolor_node
-        if not self.bgcolor_cable:
-            self.bgcolor_cable = self.bgcolor_node
-        if not self.bgcolor_bundle:
-            self.bgcolor_bundle = self.bgcolor_cable
+        self.bgcolor_node = self.bgcolor_node or self.bgcolor
+        self.bgcolor_connector = self.bgcolor_connector or self.bgcolor_node
+        self.bgcolor_cable = self.bgcolor_cable or self.bgcolor_node
+        self.bgcolor_bundle = self.bgcolor_bundle or self.bgcolor_cable
 
 
-@dataclass
+@dataclass(slots=True)
 class Tweak:
     override: Optional[Dict[Designator, Dict[str, Optional[str]]]] = None
     append: Union[str, List[str], None] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     gv_dir: InitVar[Path] # Directory of .gv file injected as context during parsing
     # Attributes of the image object <img>:
@@ -97,7 +93,7 @@ class Image:
                     self.height = self.width / aspect_ratio(gv_dir.joinpath(self.src))
 
 
-@dataclass
+@dataclass(slots=True)
 class AdditionalComponent:
     type: MultilineHypertext
     subtype: Optional[MultilineHypertext] = None
@@ -110,13 +106,14 @@ class AdditionalComponent:
     unit: Optional[str] = None
     qty_multiplier: Union[ConnectorMultiplier, CableMultiplier, None] = None
     bgcolor: Optional[Color] = None
+    description: str = field(init=False, default='')
 
-    @property
-    def description(self) -> str:
-        return self.type.rstrip() + (f', {self.subtype.rstrip()}' if self.subtype else '')
+    def __post_init__(self) -> None:
+        # plain attribute instead of a property; read repeatedly during BOM generation
+        self.description = self.type.rstrip() + (f', {self.subtype.rstrip()}' if self.subtype else '')
 
 
-@dataclass
+@dataclass(slots=True)
 class Connector:
     name: Designator
     bgcolor: Optional[Color] = None
@@ -144,16 +141,18 @@ class Connector:
     loops: List[List[Pin]] = field(default_factory=list)
     ignore_in_bom: bool = False
     additional_components: List[AdditionalComponent] = field(default_factory=list)
+    # internal attributes set during/after __post_init__, declared for the slotted layout
+    ports_left: bool = field(init=False, default=False)
+    ports_right: bool = field(init=False, default=False)
+    visible_pins: Dict[Pin, bool] = field(init=False, default_factory=dict)
+    _pin_index: Dict[Pin, PinIndex] = field(init=False, default_factory=dict)
+    _pinlabel_index: Dict[Pin, List[PinIndex]] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
 
         if isinstance(self.image, dict):
             self.image = Image(**self.image)
 
-        self.ports_left = False
-        self.ports_right = False
-        self.visible_pins = {}
-
         if self.style == 'simple':
             if self.pincount and self.pincount > 1:
                 raise Exception('Connectors with style set to simple may only have one pin')
@@ -168,8 +167,13 @@ class Connector:
         if not self.pins:
             self.pins = list(range(1, self.pincount + 1))
 
-        if len(self.pins) != len(set(self.pins)):
+        # lookup tables to avoid scanning the pin lists for every connection;
+        # a duplicate pin collapses into one dict entry, so this doubles as the uniqueness check
+        self._pin_index = {pin: index for index, pin in enumerate(self.pins)}
+        if len(self._pin_index) != len(self.pins):
             raise Exception('Pins are not unique')
+        for index, label in enumerate(self.pinlabels):
+            self._pinlabel_index.setdefault(label, []).append(index)
 
         if self.show_name is None:
             self.show_name = not self.autogenerate # hide auto-generated designators by default
@@ -184,25 +188,29 @@ class Connector:
             if len(loop) != 2:
                 raise Exception('Loops must be between exactly two pins!')
 
-        for i, item in enumerate(self.additional_components):
-            if isinstance(item, dict):
-                self.additional_components[i] = AdditionalComponent(**item)
+        self.additional_components = [AdditionalComponent(**item) if isinstance(item, dict) else item
+                                      for item in self.additional_components]
 
     def activate_pin(self, pin: Pin) -> None:
-        self.visible_pins[pin] = True
+        if pin not in self.visible_pins:  # no-op for pins already activated by another connection
+            self.visible_pins[pin] = True
+
+    # dispatch table instead of an if/elif chain; looked up per additional component
+    _qty_multipliers = {
+        'pincount': lambda self: self.pincount,
+        'populated': lambda self: sum(self.visible_pins.values()),
+    }
 
     def get_qty_multiplier(self, qty_multiplier: Optional[ConnectorMultiplier]) -> int:
         if not qty_multiplier:
             return 1
-        elif qty_multiplier == 'pincount':
-            return self.pincount
-        elif qty_multiplier == 'populated':
-            return sum(self.visible_pins.values())
-        else:
+        multiplier = self._qty_multipliers.get(qty_multiplier)
+        if multiplier is None:
             raise ValueError(f'invalid qty multiplier parameter for connector {qty_multiplier}')
+        return multiplier(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Cable:
     name: Designator
     bgcolor: Optional[Color] = None
@@ -232,23 +240,31 @@ class Cable:
     show_wirenumbers: Optional[bool] = None
     ignore_in_bom: bool = False
     additional_components: List[AdditionalComponent] = field(default_factory=list)
+    # internal attributes set during/after __post_init__, declared for the slotted layout
+    is_bundle: bool = field(init=False, default=False)
+    gauge_str: Optional[str] = field(init=False, default=None)
+    connections: List['Connection'] = field(init=False, default_factory=list)
+    _color_index: Dict[Colors, List[int]] = field(init=False, default_factory=dict)
+    _wirelabel_index: Dict[Wire, List[int]] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
 
+        self.is_bundle = self.category == 'bundle'  # checked once here instead of comparing strings at every use
+
         if isinstance(self.image, dict):
             self.image = Image(**self.image)
 
         if isinstance(self.gauge, str):  # gauge and unit specified
-            try:
-                g, u = self.gauge.split(' ')
-            except Exception:
+            g, sep, u = self.gauge.partition(' ')
+            if not sep or ' ' in u:
                 raise Exception(f'Cable {self.name} gauge={self.gauge} - Gauge must be a number, or number and unit separated by a space')
             self.gauge = g
 
             if self.gauge_unit is not None:
                 print(f'Warning: Cable {self.name} gauge_unit={self.gauge_unit} is ignored because its gauge contains {u}')
-            if u.upper() == 'AWG':
-                self.gauge_unit = u.upper()
+            u_upper = u.upper()
+            if u_upper == 'AWG':
+                self.gauge_unit = u_upper
             else:
                 self.gauge_unit = u.replace('mm2', 'mm\u00B2')
 
@@ -258,23 +274,36 @@ class Cable:
         else:
             pass  # gauge not specified
 
+        if self.gauge:
+            # pre-render the gauge text shown in diagram labels, including the
+            # equivalent gauge when requested. Only convert units we actually
+            # know about, i.e. currently mm2 and awg --- other units _are_
+            # technically allowed, and passed through as-is.
+            equiv = ''
+            if self.show_equiv:
+                if self.gauge_unit == 'mm\u00B2':
+                    equiv = f' ({awg_equiv(self.gauge)} AWG)'
+                elif self.gauge_unit.upper() == 'AWG':
+                    equiv = f' ({mm2_equiv(self.gauge)} mm\u00B2)'
+            self.gauge_str = f'{self.gauge} {self.gauge_unit}{equiv}'
+
         if isinstance(self.length, str):  # length and unit specified
+            L, sep, u = self.length.partition(' ')
             try:
-                L, u = self.length.split(' ')
+                if not sep or ' ' in u:
+                    raise ValueError
                 L = float(L)
-            except Exception:
+            except ValueError:
                 raise Exception(f'Cable {self.name} length={self.length} - Length must be a number, or number and unit separated by a space')
             self.length = L
             if self.length_unit is not None:
                 print(f'Warning: Cable {self.name} length_unit={self.length_unit} is ignored because its length contains {u}')
             self.length_unit = u
-        elif not any(isinstance(self.length, t) for t in [int, float]):
+        elif not isinstance(self.length, (int, float)):
             raise Exception(f'Cable {self.name} length has a non-numeric value')
         elif self.length_unit is None:
             self.length_unit = 'm'
 
-        self.connections = []
-
         if self.wirecount:  # number of wires explicitly defined
             if self.colors:  # use custom color palette (partly or looped if needed)
                 pass
@@ -285,11 +314,10 @@ class Cable:
             else:  # no colors defined, add dummy colors
                 self.colors = [''] * self.wirecount
 
-            # make color code loop around if more wires than colors
+            # make color code loop around if more wires than colors (ceil division),
+            # then cut off any excess
             if self.wirecount > len(self.colors):
-                m = self.wirecount // len(self.colors) + 1
-                self.colors = self.colors * int(m)
-            # cut off excess after looping
+                self.colors = self.colors * (-(-self.wirecount // len(self.colors)))
             self.colors = self.colors[:self.wirecount]
         else:  # wirecount implicit in length of color list
             if not self.colors:
@@ -300,10 +328,16 @@ class Cable:
             if self.shield and 's' in self.wirelabels:
                 raise Exception('"s" may not be used as a wire label for a shielded cable.')
 
+        # lookup tables to avoid scanning the color/label lists for every connection
+        for index, color in enumerate(self.colors):
+            self._color_index.setdefault(color, []).append(index)
+        for index, label in enumerate(self.wirelabels):
+            self._wirelabel_index.setdefault(label, []).append(index)
+
         # if lists of part numbers are provided check this is a bundle and that it matches the wirecount.
         for idfield in [self.manufacturer, self.mpn, self.supplier, self.spn, self.pn]:
             if isinstance(idfield, list):
-                if self.category == "bundle":
+                if self.is_bundle:
                     # check the length
                     if len(idfield) != self.wirecount:
                         raise Exception('lists of part data must match wirecount')
@@ -312,11 +346,10 @@ class Cable:
 
         # by default, show wire numbers for cables, hide for bundles
         if self.show_wirenumbers is None:
-            self.show_wirenumbers = self.category != 'bundle'
+            self.show_wirenumbers = not self.is_bundle
 
-        for i, item in enumerate(self.additional_components):
-            if isinstance(item, dict):
-                self.additional_components[i] = AdditionalComponent(**item)
+        self.additional_components = [AdditionalComponent(**item) if isinstance(item, dict) else item
+                                      for item in self.additional_components]
 
     # The *_pin arguments accept a tuple, but it seems not in use with the current code.
     def connect(self, from_name: Optional[Designator], from_pin: NoneOrMorePinIndices, via_wire: OneOrMoreWires,
@@ -329,22 +362,24 @@ class Cable:
         for i, _ in enumerate(from_pin):
             self.connections.append(Connection(from_name, from_pin[i], via_wire[i], to_name, to_pin[i]))
 
+    # dispatch table instead of an if/elif chain; looked up per additional component
+    _qty_multipliers = {
+        'wirecount': lambda self: self.wirecount,
+        'terminations': lambda self: len(self.connections),
+        'length': lambda self: self.length,
+        'total_length': lambda self: self.length * self.wirecount,
+    }
+
     def get_qty_multiplier(self, qty_multiplier: Optional[CableMultiplier]) -> float:
         if not qty_multiplier:
             return 1
-        elif qty_multiplier == 'wirecount':
-            return self.wirecount
-        elif qty_multiplier == 'terminations':
-            return len(self.connections)
-        elif qty_multiplier == 'length':
-            return self.length
-        elif qty_multiplier == 'total_length':
-            return self.length * self.wirecount
-        else:
+        multiplier = self._qty_multipliers.get(qty_multiplier)
+        if multiplier is None:
             raise ValueError(f'invalid qty multiplier parameter for cable {qty_multiplier}')
+        return multiplier(self)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)  # one instance per wire termination; never mutated after creation
 class Connection:
     from_name: Optional[Designator]
     from_port: Optional[PinIndex]
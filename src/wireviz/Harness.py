@@ -1,26 +1,27 @@
 # -*- coding: utf-8 -*-
 
-from graphviz import Graph
-from collections import Counter
 from typing import Any, List, Union
 from dataclasses import dataclass
 from pathlib import Path
-from itertools import zip_longest
+from itertools import groupby
 import re
+import sys
 
 from wireviz import wv_colors, __version__, APP_NAME, APP_URL
 from wireviz.DataClasses import Metadata, Options, Tweak, Connector, Cable
-from wireviz.wv_colors import get_color_hex, translate_color
+from wireviz.wv_colors import translate_color
 from wireviz.wv_gv_html import nested_html_table, \
     html_bgcolor_attr, html_bgcolor, html_colorbar, \
     html_image, html_caption, remove_links, html_line_breaks
 from wireviz.wv_bom import pn_info_string, component_table_entry, \
-    get_additional_component_table, bom_list, generate_bom, \
+    get_additional_component_table, bom_list, generate_bom, bom_entry_key, \
     HEADER_PN, HEADER_MPN, HEADER_SPN
-from wireviz.wv_html import generate_html_output
-from wireviz.wv_helper import awg_equiv, mm2_equiv, tuplelist2tsv, flatten2d, \
+from wireviz.wv_helper import tuplelist2tsv, flatten2d, \
     open_file_read, open_file_write
 
+# Node count above which cheaper Graphviz layout settings are applied in create_graph()
+LARGE_GRAPH_NODE_THRESHOLD = 50
+
 
 @dataclass
 class Harness:
@@ -32,66 +33,94 @@ class Harness:
         self.connectors = {}
         self.cables = {}
         self._bom = []  # Internal Cache for generated bom
+        self._bom_index = {}  # Internal cache mapping BOM entry keys to ids
+        self._graph = None  # Internal cache for generated graph
+        self._piped = {}  # Internal cache for rendered graph output, keyed by format
+        self._node_html_cache = {}  # Internal cache for connector node labels, keyed by name
         self.additional_bom_items = []
 
+    def _invalidate(self) -> None:
+        # Discard cached graph/render/BOM data after the harness structure changes
+        self._bom = []
+        self._bom_index = {}
+        self._graph = None
+        self._piped = {}
+        self._node_html_cache = {}
+
     def add_connector(self, name: str, *args, **kwargs) -> None:
+        name = sys.intern(name)  # designators recur as dict keys and BOM set members; intern for fast hashing
         self.connectors[name] = Connector(name, *args, **kwargs)
+        self._invalidate()
 
     def add_cable(self, name: str, *args, **kwargs) -> None:
+        name = sys.intern(name)
         self.cables[name] = Cable(name, *args, **kwargs)
+        self._invalidate()
 
     def add_bom_item(self, item: dict) -> None:
         self.additional_bom_items.append(item)
+        self._invalidate()
+
+    def _resolve_pin(self, name: str, pin: (int, str)) -> (int, str):
+        # map a pin label to its pin number if needed, verifying the pin exists
+        connector = self.connectors[name]
+        label_indices = connector._pinlabel_index.get(pin)
+        # check if provided name is ambiguous
+        if pin in connector._pin_index and label_indices:
+            if connector._pin_index[pin] != label_indices[0]:
+                raise Exception(f'{name}:{pin} is defined both in pinlabels and pins, for different pins.')
+            # TODO: Maybe issue a warning if present in both lists but referencing the same pin?
+        if label_indices:
+            if len(label_indices) > 1:
+                raise Exception(f'{name}:{pin} is defined more than once.')
+            pin = connector.pins[label_indices[0]] # map pin name to pin number
+        if not pin in connector._pin_index:
+            raise Exception(f'{name}:{pin} not found.')
+        return pin
 
     def connect(self, from_name: str, from_pin: (int, str), via_name: str, via_wire: (int, str), to_name: str, to_pin: (int, str)) -> None:
         # check from and to connectors
-        for (name, pin) in zip([from_name, to_name], [from_pin, to_pin]):
-            if name is not None and name in self.connectors:
-                connector = self.connectors[name]
-                # check if provided name is ambiguous
-                if pin in connector.pins and pin in connector.pinlabels:
-                    if connector.pins.index(pin) != connector.pinlabels.index(pin):
-                        raise Exception(f'{name}:{pin} is defined both in pinlabels and pins, for different pins.')
-                    # TODO: Maybe issue a warning if present in both lists but referencing the same pin?
-                if pin in connector.pinlabels:
-                    if connector.pinlabels.count(pin) > 1:
-                        raise Exception(f'{name}:{pin} is defined more than once.')
-                    index = connector.pinlabels.index(pin)
-                    pin = connector.pins[index] # map pin name to pin number
-                    if name == from_name:
-                        from_pin = pin
-                    if name == to_name:
-                        to_pin = pin
-                if not pin in connector.pins:
-                    raise Exception(f'{name}:{pin} not found.')
+        if from_name is not None and from_name in self.connectors:
+            from_pin = self._resolve_pin(from_name, from_pin)
+        if to_name is not None and to_name in self.connectors:
+            to_pin = self._resolve_pin(to_name, to_pin)
 
         # check via cable
         if via_name in self.cables:
             cable = self.cables[via_name]
+            color_indices = cable._color_index.get(via_wire)
+            wirelabel_indices = cable._wirelabel_index.get(via_wire)
             # check if provided name is ambiguous
-            if via_wire in cable.colors and via_wire in cable.wirelabels:
-                if cable.colors.index(via_wire) != cable.wirelabels.index(via_wire):
+            if color_indices and wirelabel_indices:
+                if color_indices[0] != wirelabel_indices[0]:
                     raise Exception(f'{via_name}:{via_wire} is defined both in colors and wirelabels, for different wires.')
                 # TODO: Maybe issue a warning if present in both lists but referencing the same wire?
-            if via_wire in cable.colors:
-                if cable.colors.count(via_wire) > 1:
+            if color_indices:
+                if len(color_indices) > 1:
                     raise Exception(f'{via_name}:{via_wire} is used for more than one wire.')
-                via_wire = cable.colors.index(via_wire) + 1  # list index starts at 0, wire IDs start at 1
-            elif via_wire in cable.wirelabels:
-                if cable.wirelabels.count(via_wire) > 1:
+                via_wire = color_indices[0] + 1  # list index starts at 0, wire IDs start at 1
+            elif wirelabel_indices:
+                if len(wirelabel_indices) > 1:
                     raise Exception(f'{via_name}:{via_wire} is used for more than one wire.')
-                via_wire = cable.wirelabels.index(via_wire) + 1  # list index starts at 0, wire IDs start at 1
+                via_wire = wirelabel_indices[0] + 1  # list index starts at 0, wire IDs start at 1
 
-        from_pin_id = self.connectors[from_name].pins.index(from_pin) if from_pin is not None else None
-        to_pin_id = self.connectors[to_name].pins.index(to_pin) if to_pin is not None else None
+        # look each connector up once and reuse the binding below
+        from_connector = self.connectors.get(from_name)
+        to_connector = self.connectors.get(to_name)
+        from_pin_id = from_connector._pin_index[from_pin] if from_pin is not None else None
+        to_pin_id = to_connector._pin_index[to_pin] if to_pin is not None else None
 
         self.cables[via_name].connect(from_name, from_pin_id, via_wire, to_name, to_pin_id)
-        if from_name in self.connectors:
-            self.connectors[from_name].activate_pin(from_pin)
-        if to_name in self.connectors:
-            self.connectors[to_name].activate_pin(to_pin)
-
-    def create_graph(self) -> Graph:
+        if from_connector is not None:
+            from_connector.activate_pin(from_pin)
+        if to_connector is not None:
+            to_connector.activate_pin(to_pin)
+        self._invalidate()
+
+    def create_graph(self) -> 'Graph':
+        # graphviz pulls in subprocess machinery; import it only when a graph is actually built
+        from graphviz import Graph
+        from graphviz.quoting import quote_edge
         dot = Graph()
         dot.body.append(f'// Graph generated by {APP_NAME} {__version__}\n')
         dot.body.append(f'// {APP_URL}\n')
@@ -109,6 +138,11 @@ class Harness:
         dot.attr('edge', style='bold',
                  fontname=self.options.fontname)
 
+        # spline routing dominates layout time on large graphs; fall back to faster settings there.
+        # users can still override these via tweak.override on the graph keyword.
+        if len(self.connectors) + len(self.cables) > LARGE_GRAPH_NODE_THRESHOLD:
+            dot.attr('graph', splines='ortho', outputorder='edgesfirst')
+
         # prepare ports on connectors depending on which side they will connect
         for _, cable in self.cables.items():
             for connection_color in cable.connections:
@@ -123,58 +157,79 @@ class Harness:
             if not (connector.ports_left or connector.ports_right):
                 connector.ports_left = True  # Use left side pins.
 
-            html = []
-
-            rows = [[f'{html_bgcolor(connector.bgcolor_title)}{remove_links(connector.name)}'
-                        if connector.show_name else None],
-                    [pn_info_string(HEADER_PN, None, remove_links(connector.pn)),
-                     html_line_breaks(pn_info_string(HEADER_MPN, connector.manufacturer, connector.mpn)),
-                     html_line_breaks(pn_info_string(HEADER_SPN, connector.supplier, connector.spn))],
-                    [html_line_breaks(connector.type),
-                     html_line_breaks(connector.subtype),
-                     f'{connector.pincount}-pin' if connector.show_pincount else None,
-                     translate_color(connector.color, self.options.color_mode) if connector.color else None,
-                     html_colorbar(connector.color)],
-                    '<!-- connector table -->' if connector.style != 'simple' else None,
-                    [html_image(connector.image)],
-                    [html_caption(connector.image)]]
-            rows.extend(get_additional_component_table(self, connector))
-            rows.append([html_line_breaks(connector.notes)])
-            html.extend(nested_html_table(rows, html_bgcolor_attr(connector.bgcolor)))
-
-            if connector.style != 'simple':
-                pinhtml = []
-                pinhtml.append('<table border="0" cellspacing="0" cellpadding="3" cellborder="1">')
-
-                for pinindex, (pinname, pinlabel, pincolor) in enumerate(zip_longest(connector.pins, connector.pinlabels, connector.pincolors)):
-                    if connector.hide_disconnected_pins and not connector.visible_pins.get(pinname, False):
-                        continue
-                    pinhtml.append('   <tr>')
-                    if connector.ports_left:
-                        pinhtml.append(f'    <td port="p{pinindex+1}l">{pinname}</td>')
-                    if pinlabel:
-                        pinhtml.append(f'    <td>{pinlabel}</td>')
-                    if connector.pincolors:
-                        if pincolor in wv_colors._color_hex.keys():
-                            pinhtml.append(f'    <td sides="tbl">{translate_color(pincolor, self.options.color_mode)}</td>')
-                            pinhtml.append( '    <td sides="tbr">')
-                            pinhtml.append( '     <table border="0" cellborder="1"><tr>')
-                            pinhtml.append(f'      <td bgcolor="{wv_colors.translate_color(pincolor, "HEX")}" width="8" height="8" fixedsize="true"></td>')
-                            pinhtml.append( '     </tr></table>')
-                            pinhtml.append( '    </td>')
-                        else:
-                            pinhtml.append( '    <td colspan="2"></td>')
-
-                    if connector.ports_right:
-                        pinhtml.append(f'    <td port="p{pinindex+1}r">{pinname}</td>')
-                    pinhtml.append('   </tr>')
-
-                pinhtml.append('  </table>')
-
-                html = [row.replace('<!-- connector table -->', '\n'.join(pinhtml)) for row in html]
-
-            html = '\n'.join(html)
-            dot.node(connector.name, label=f'<\n{html}\n>', shape='box', style='filled',
+            # building the node label is pure string work; reuse it until the structure changes
+            label = self._node_html_cache.get(connector.name)
+            if label is None:
+                html = []
+
+                rows = [[f'{html_bgcolor(connector.bgcolor_title)}{remove_links(connector.name)}'
+                            if connector.show_name else None],
+                        [pn_info_string(HEADER_PN, None, remove_links(connector.pn)),
+                         html_line_breaks(pn_info_string(HEADER_MPN, connector.manufacturer, connector.mpn)),
+                         html_line_breaks(pn_info_string(HEADER_SPN, connector.supplier, connector.spn))],
+                        [html_line_breaks(connector.type),
+                         html_line_breaks(connector.subtype),
+                         f'{connector.pincount}-pin' if connector.show_pincount else None,
+                         translate_color(connector.color, self.options.color_mode) if connector.color else None,
+                         html_colorbar(connector.color)],
+                        '<!-- connector table -->' if connector.style != 'simple' else None,
+                        [html_image(connector.image)],
+                        [html_caption(connector.image)]]
+                rows.extend(get_additional_component_table(self, connector))
+                rows.append([html_line_breaks(connector.notes)])
+                html.extend(nested_html_table(rows, html_bgcolor_attr(connector.bgcolor)))
+
+                if connector.style != 'simple':
+                    pinhtml = []
+                    pinhtml.append('<table border="0" cellspacing="0" cellpadding="3" cellborder="1">')
+
+                    # loop-invariant connector attributes, hoisted out of the per-pin iteration
+                    color_mode = self.options.color_mode
+                    ports_left = connector.ports_left
+                    ports_right = connector.ports_right
+                    has_pincolors = bool(connector.pincolors)
+                    hide_disconnected = connector.hide_disconnected_pins
+                    pin_visible = connector.visible_pins.get  # pre-bound; consulted once per pin
+
+                    # pad the sparse lists up front so the loop can use plain zip instead of zip_longest
+                    pins, pinlabels, pincolors = connector.pins, connector.pinlabels, connector.pincolors
+                    rowcount = max(len(pins), len(pinlabels), len(pincolors))
+                    pins = pins + [None] * (rowcount - len(pins))
+                    pinlabels = pinlabels + [None] * (rowcount - len(pinlabels))
+                    pincolors = pincolors + [None] * (rowcount - len(pincolors))
+
+                    for pinindex, (pinname, pinlabel, pincolor) in enumerate(zip(pins, pinlabels, pincolors)):
+                        if hide_disconnected and not pin_visible(pinname, False):
+                            continue
+                        pinhtml.append('   <tr>')
+                        if ports_left:
+                            pinhtml.append(f'    <td port="p{pinindex+1}l">{pinname}</td>')
+                        if pinlabel:
+                            pinhtml.append(f'    <td>{pinlabel}</td>')
+                        if has_pincolors:
+                            if pincolor in wv_colors._color_hex:
+                                pinhtml.append(f'    <td sides="tbl">{translate_color(pincolor, color_mode)}</td>')
+                                pinhtml.append( '    <td sides="tbr">')
+                                pinhtml.append( '     <table border="0" cellborder="1"><tr>')
+                                pinhtml.append(f'      <td bgcolor="{wv_colors.translate_color(pincolor, "HEX")}" width="8" height="8" fixedsize="true"></td>')
+                                pinhtml.append( '     </tr></table>')
+                                pinhtml.append( '    </td>')
+                            else:
+                                pinhtml.append( '    <td colspan="2"></td>')
+
+                        if ports_right:
+                            pinhtml.append(f'    <td port="p{pinindex+1}r">{pinname}</td>')
+                        pinhtml.append('   </tr>')
+
+                    pinhtml.append('  </table>')
+
+                    html = [row.replace('<!-- connector table -->', '\n'.join(pinhtml)) for row in html]
+
+                html = '\n'.join(html)
+                label = f'<\n{html}\n>'
+                self._node_html_cache[connector.name] = label
+
+            dot.node(connector.name, label=label, shape='box', style='filled',
                      fillcolor=translate_color(self.options.bgcolor_connector, "HEX"))
 
             if len(connector.loops) > 0:
@@ -200,16 +255,6 @@ class Harness:
 
             html = []
 
-            awg_fmt = ''
-            if cable.show_equiv:
-                # Only convert units we actually know about, i.e. currently
-                # mm2 and awg --- other units _are_ technically allowed,
-                # and passed through as-is.
-                if cable.gauge_unit =='mm\u00B2':
-                    awg_fmt = f' ({awg_equiv(cable.gauge)} AWG)'
-                elif cable.gauge_unit.upper() == 'AWG':
-                    awg_fmt = f' ({mm2_equiv(cable.gauge)} mm\u00B2)'
-
             rows = [[f'{html_bgcolor(cable.bgcolor_title)}{remove_links(cable.name)}'
                         if cable.show_name else None],
                     [pn_info_string(HEADER_PN, None,
@@ -222,7 +267,7 @@ class Harness:
                         cable.spn if not isinstance(cable.spn, list) else None))],
                     [html_line_breaks(cable.type),
                      f'{cable.wirecount}x' if cable.show_wirecount else None,
-                     f'{cable.gauge} {cable.gauge_unit}{awg_fmt}' if cable.gauge else None,
+                     cable.gauge_str,
                      '+ S' if cable.shield else None,
                      f'{cable.length} {cable.length_unit}' if cable.length > 0 else None,
                      translate_color(cable.color, self.options.color_mode) if cable.color else None,
@@ -239,7 +284,13 @@ class Harness:
             wirehtml.append('<table border="0" cellspacing="0" cellborder="0">')  # conductor table
             wirehtml.append('   <tr><td>&nbsp;</td></tr>')
 
-            for i, (connection_color, wirelabel) in enumerate(zip_longest(cable.colors, cable.wirelabels), 1):
+            # pad the sparse lists up front so the loop can use plain zip instead of zip_longest
+            colors, wirelabels = cable.colors, cable.wirelabels
+            rowcount = max(len(colors), len(wirelabels))
+            colors = colors + [None] * (rowcount - len(colors))
+            wirelabels = wirelabels + [None] * (rowcount - len(wirelabels))
+
+            for i, (connection_color, wirelabel) in enumerate(zip(colors, wirelabels), 1):
                 wirehtml.append('   <tr>')
                 wirehtml.append(f'    <td><!-- {i}_in --></td>')
                 wirehtml.append(f'    <td>')
@@ -258,7 +309,7 @@ class Harness:
                 wirehtml.append(f'    <td><!-- {i}_out --></td>')
                 wirehtml.append('   </tr>')
 
-                bgcolors = ['#000000'] + get_color_hex(connection_color, pad=pad) + ['#000000']
+                bgcolors = wv_colors.get_color_hex_framed(connection_color, pad=pad)
                 wirehtml.append(f'   <tr>')
                 wirehtml.append(f'    <td colspan="3" border="0" cellspacing="0" cellpadding="0" port="w{i}" height="{(2 * len(bgcolors))}">')
                 wirehtml.append('     <table cellspacing="0" cellborder="0" border="0">')
@@ -267,7 +318,7 @@ class Harness:
                 wirehtml.append('     </table>')
                 wirehtml.append('    </td>')
                 wirehtml.append('   </tr>')
-                if cable.category == 'bundle':  # for bundles individual wires can have part information
+                if cable.is_bundle:  # for bundles individual wires can have part information
                     # create a list of wire parameters
                     wireidentification = []
                     if isinstance(cable.pn, list):
@@ -313,46 +364,60 @@ class Harness:
             html = [row.replace('<!-- wire table -->', '\n'.join(wirehtml)) for row in html]
 
             # connections
+            edges = []  # collect (color, from, to) tuples for batched emission after the loop
             for connection in cable.connections:
-                if isinstance(connection.via_port, int):  # check if it's an actual wire and not a shield
-                    dot.attr('edge', color=':'.join(['#000000'] + wv_colors.get_color_hex(cable.colors[connection.via_port - 1], pad=pad) + ['#000000']))
+                # unpack the connection fields once instead of re-reading attributes below
+                via_port = connection.via_port
+                from_name, from_pin_index = connection.from_name, connection.from_port
+                to_name, to_pin_index = connection.to_name, connection.to_port
+                if isinstance(via_port, int):  # check if it's an actual wire and not a shield
+                    edge_color = ':'.join(wv_colors.get_color_hex_framed(cable.colors[via_port - 1], pad=pad))
                 else:  # it's a shield connection
                     # shield is shown with specified color and black borders, or as a thin black wire otherwise
-                    dot.attr('edge', color=':'.join(['#000000', shield_color_hex, '#000000']) if isinstance(cable.shield, str) else '#000000')
-                if connection.from_port is not None:  # connect to left
-                    from_connector = self.connectors[connection.from_name]
-                    from_port = f':p{connection.from_port+1}r' if from_connector.style != 'simple' else ''
-                    code_left_1 = f'{connection.from_name}{from_port}:e'
-                    code_left_2 = f'{cable.name}:w{connection.via_port}:w'
-                    dot.edge(code_left_1, code_left_2)
+                    edge_color = ':'.join(['#000000', shield_color_hex, '#000000']) if isinstance(cable.shield, str) else '#000000'
+                if from_pin_index is not None:  # connect to left
+                    from_connector = self.connectors[from_name]
+                    from_port = f':p{from_pin_index+1}r' if from_connector.style != 'simple' else ''
+                    code_left_1 = f'{from_name}{from_port}:e'
+                    code_left_2 = f'{cable.name}:w{via_port}:w'
+                    edges.append((edge_color, code_left_1, code_left_2))
                     if from_connector.show_name:
-                        from_info = [str(connection.from_name), str(self.connectors[connection.from_name].pins[connection.from_port])]
+                        from_info = [str(from_name), str(from_connector.pins[from_pin_index])]
                         if from_connector.pinlabels:
-                            pinlabel = from_connector.pinlabels[connection.from_port]
+                            pinlabel = from_connector.pinlabels[from_pin_index]
                             if pinlabel != '':
                                 from_info.append(pinlabel)
                         from_string = ':'.join(from_info)
                     else:
                         from_string = ''
-                    html = [row.replace(f'<!-- {connection.via_port}_in -->', from_string) for row in html]
-                if connection.to_port is not None:  # connect to right
-                    to_connector = self.connectors[connection.to_name]
-                    code_right_1 = f'{cable.name}:w{connection.via_port}:e'
-                    to_port = f':p{connection.to_port+1}l' if self.connectors[connection.to_name].style != 'simple' else ''
-                    code_right_2 = f'{connection.to_name}{to_port}:w'
-                    dot.edge(code_right_1, code_right_2)
+                    html = [row.replace(f'<!-- {via_port}_in -->', from_string) for row in html]
+                if to_pin_index is not None:  # connect to right
+                    to_connector = self.connectors[to_name]
+                    code_right_1 = f'{cable.name}:w{via_port}:e'
+                    to_port = f':p{to_pin_index+1}l' if to_connector.style != 'simple' else ''
+                    code_right_2 = f'{to_name}{to_port}:w'
+                    edges.append((edge_color, code_right_1, code_right_2))
                     if to_connector.show_name:
-                        to_info = [str(connection.to_name), str(self.connectors[connection.to_name].pins[connection.to_port])]
+                        to_info = [str(to_name), str(to_connector.pins[to_pin_index])]
                         if to_connector.pinlabels:
-                            pinlabel = to_connector.pinlabels[connection.to_port]
+                            pinlabel = to_connector.pinlabels[to_pin_index]
                             if pinlabel != '':
                                 to_info.append(pinlabel)
                         to_string = ':'.join(to_info)
                     else:
                         to_string = ''
-                    html = [row.replace(f'<!-- {connection.via_port}_out -->', to_string) for row in html]
-
-            style, bgcolor = ('filled,dashed', self.options.bgcolor_bundle) if cable.category == 'bundle' else \
+                    html = [row.replace(f'<!-- {via_port}_out -->', to_string) for row in html]
+
+            # emit edges grouped by color so each edge attribute statement covers a whole group;
+            # pre-format the DOT lines and append them to the body in one go instead of going
+            # through dot.attr()/dot.edge() for every single wire
+            edge_lines = []
+            for edge_color, group in groupby(sorted(edges, key=lambda e: e[0]), key=lambda e: e[0]):
+                edge_lines.append(f'\tedge [color="{edge_color}"]\n')
+                edge_lines.extend(f'\t{quote_edge(code_1)} -- {quote_edge(code_2)}\n' for _, code_1, code_2 in group)
+            dot.body.extend(edge_lines)
+
+            style, bgcolor =('filled,dashed', self.options.bgcolor_bundle) if cable.is_bundle else \
                              ('filled',        self.options.bgcolor_cable)
             html = '\n'.join(html)
             dot.node(cable.name, label=f'<\n{html}\n>', shape='box',
@@ -411,39 +476,70 @@ class Harness:
 
         return dot
 
+    @property
+    def graph(self) -> 'Graph':
+        if self._graph is None:
+            self._graph = self.create_graph()
+        return self._graph
+
+    def _pipe(self, fmt: str) -> bytes:
+        # Piping the graph through the layout engine is expensive; cache the result per format
+        data = self._piped.get(fmt)
+        if data is None:
+            data = self._piped[fmt] = self.graph.pipe(format=fmt)
+        return data
+
     @property
     def png(self):
-        from io import BytesIO
-        graph = self.create_graph()
-        data = BytesIO()
-        data.write(graph.pipe(format='png'))
-        data.seek(0)
-        return data.read()
+        return self._pipe('png')
 
     @property
     def svg(self):
-        from io import BytesIO
-        graph = self.create_graph()
-        data = BytesIO()
-        data.write(graph.pipe(format='svg'))
-        data.seek(0)
-        return data.read()
+        return self._pipe('svg')
 
     def output(self, filename: (str, Path), view: bool = False, cleanup: bool = True, fmt: tuple = ('pdf', )) -> None:
-        # graphical output
-        graph = self.create_graph()
-        for f in fmt:
-            graph.format = f
-            graph.render(filename=filename, view=view, cleanup=cleanup)
-        graph.save(filename=f'{filename}.gv')
-        # bom output
+        # build each derived filename once up front
+        filename_str = str(filename)
+        # normalize requested formats; HTML output embeds the SVG, so render each graphical format only once
+        fmt = set(fmt)
+        needed = {'svg' if f == 'html' else f for f in fmt if f not in ('tsv', 'csv', 'bom')}
+        # bom output first, so BOM-only calls never build the graph at all
         bomlist = bom_list(self.bom())
-        with open_file_write(f'{filename}.bom.tsv') as file:
-            file.write(tuplelist2tsv(bomlist))
+        if len(bomlist) > 1:  # bom_list() always returns the header row; skip the file if that is all
+            with open_file_write(f'{filename_str}.bom.tsv') as file:
+                file.write(tuplelist2tsv(bomlist))
+        if not needed:
+            return
+        # graphical output
+        graph = self.graph
+        if view or len(needed) <= 1:
+            for f in needed:
+                graph.format = f
+                graph.render(filename=filename, view=view, cleanup=cleanup)
+        else:
+            # each format waits on its own external dot process, so render them concurrently;
+            # pipe per format instead of mutating the shared graph.format attribute
+            from concurrent.futures import ThreadPoolExecutor
+
+            def render_format(f: str) -> None:
+                with open(f'{filename_str}.{f}', 'wb') as file:
+                    file.write(self._pipe(f))
+
+            with ThreadPoolExecutor(max_workers=len(needed)) as executor:
+                for _ in executor.map(render_format, needed):
+                    pass  # consume the iterator to propagate any render exceptions
+        graph.save(filename=f'{filename_str}.gv')
         # HTML output
+        from wireviz.wv_html import generate_html_output
         generate_html_output(filename, bomlist, self.metadata, self.options)
 
     def bom(self):
         if not self._bom:
             self._bom = generate_bom(self)
         return self._bom
+
+    def bom_index(self):
+        """Return a dict mapping BOM entry keys to entry ids for O(1) lookups."""
+        if not self._bom_index:
+            self._bom_index = {bom_entry_key(entry): entry['id'] for entry in self.bom()}
+        return self._bom_index
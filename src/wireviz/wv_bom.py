@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from dataclasses import asdict
-from itertools import groupby
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from wireviz.DataClasses import AdditionalComponent, Cable, Color, Connector
@@ -21,10 +21,17 @@ BOMKey = Tuple[str, ...]
 BOMColumn = str  # = Literal[*BOM_COLUMNS_ALWAYS, *BOM_COLUMNS_OPTIONAL]
 BOMEntry = Dict[BOMColumn, Union[str, int, float, List[str], None]]
 
+@dataclass(slots=True)
+class _BomGroup:
+    """Accumulator for BOM entries sharing the same key."""
+    first_entry: BOMEntry
+    qty: float = 0
+    designators: set = field(default_factory=set)
+
 def optional_fields(part: Union[Connector, Cable, AdditionalComponent]) -> BOMEntry:
     """Return part field values for the optional BOM columns as a dict."""
-    part = asdict(part)
-    return {field: part.get(field) for field in BOM_COLUMNS_OPTIONAL}
+    # asdict() would recursively copy the whole part; only five attributes are needed
+    return {field: getattr(part, field) for field in BOM_COLUMNS_OPTIONAL}
 
 def get_additional_component_table(harness: "Harness", component: Union[Connector, Cable]) -> List[str]:
     """Return a list of diagram node table row strings with additional components."""
@@ -38,7 +45,10 @@ def get_additional_component_table(harness: "Harness", component: Union[Connecto
                 'bgcolor': part.bgcolor,
             }
             if harness.options.mini_bom_mode:
-                id = get_bom_index(harness.bom(), bom_entry_key({**asdict(part), 'description': part.description}))
+                key = bom_entry_key({**asdict(part), 'description': part.description})
+                id = harness.bom_index().get(key)
+                if id is None:
+                    raise Exception('Internal error: No BOM entry found matching: ' + '|'.join(key))
                 rows.append(component_table_entry(f'#{id} ({part.type.rstrip()})', **common_args))
             else:
                 rows.append(component_table_entry(part.description, **common_args, **optional_fields(part)))
@@ -66,6 +76,7 @@ def bom_entry_key(entry: BOMEntry) -> BOMKey:
 def generate_bom(harness: "Harness") -> List[BOMEntry]:
     """Return a list of BOM entries generated from the harness."""
     from wireviz.Harness import Harness  # Local import to avoid circular imports
+    color_mode = harness.options.color_mode
     bom_entries = []
     # connectors
     for connector in harness.connectors.values():
@@ -74,7 +85,7 @@ def generate_bom(harness: "Harness") -> List[BOMEntry]:
                            + (f', {connector.type}' if connector.type else '')
                            + (f', {connector.subtype}' if connector.subtype else '')
                            + (f', {connector.pincount} pins' if connector.show_pincount else '')
-                           + (f', {translate_color(connector.color, harness.options.color_mode)}' if connector.color else ''))
+                           + (f', {translate_color(connector.color, color_mode)}' if connector.color else ''))
             bom_entries.append({
                 'description': description, 'designators': connector.name if connector.show_name else None,
                 **optional_fields(connector),
@@ -87,25 +98,26 @@ def generate_bom(harness: "Harness") -> List[BOMEntry]:
     # TODO: If category can have other non-empty values than 'bundle', maybe it should be part of description?
     for cable in harness.cables.values():
         if not cable.ignore_in_bom:
-            if cable.category != 'bundle':
+            if not cable.is_bundle:
                 # process cable as a single entity
                 description = ('Cable'
                                + (f', {cable.type}' if cable.type else '')
                                + (f', {cable.wirecount}')
                                + (f' x {cable.gauge} {cable.gauge_unit}' if cable.gauge else ' wires')
                                + ( ' shielded' if cable.shield else '')
-                               + (f', {translate_color(cable.color, harness.options.color_mode)}' if cable.color else ''))
+                               + (f', {translate_color(cable.color, color_mode)}' if cable.color else ''))
                 bom_entries.append({
                     'description': description, 'qty': cable.length, 'unit': cable.length_unit, 'designators': cable.name if cable.show_name else None,
                     **optional_fields(cable),
                 })
             else:
-                # add each wire from the bundle to the bom
+                # add each wire from the bundle to the bom;
+                # only the color varies per wire, so format the rest of the description once
+                wire_prefix = ('Wire'
+                               + (f', {cable.type}' if cable.type else '')
+                               + (f', {cable.gauge} {cable.gauge_unit}' if cable.gauge else ''))
                 for index, color in enumerate(cable.colors):
-                    description = ('Wire'
-                                   + (f', {cable.type}' if cable.type else '')
-                                   + (f', {cable.gauge} {cable.gauge_unit}' if cable.gauge else '')
-                                   + (f', {translate_color(color, harness.options.color_mode)}' if color else ''))
+                    description = wire_prefix + (f', {translate_color(color, color_mode)}' if color else '')
                     bom_entries.append({
                         'description': description, 'qty': cable.length, 'unit': cable.length_unit, 'designators': cable.name if cable.show_name else None,
                         **{k: index_if_list(v, index) for k, v in optional_fields(cable).items()},
@@ -114,19 +126,28 @@ def generate_bom(harness: "Harness") -> List[BOMEntry]:
         # add cable/bundles aditional components to bom
         bom_entries.extend(get_additional_component_bom(cable))
 
-    # add harness aditional components to bom directly, as they both are List[BOMEntry]
-    bom_entries.extend(harness.additional_bom_items)
-
-    # remove line breaks if present and cleanup any resulting whitespace issues
-    bom_entries = [{k: clean_whitespace(v) for k, v in entry.items()} for entry in bom_entries]
-
-    # deduplicate bom
-    bom = []
-    for _, group in groupby(sorted(bom_entries, key=bom_entry_key), key=bom_entry_key):
-        group_entries = list(group)
-        designators = sum((make_list(entry.get('designators')) for entry in group_entries), [])
-        total_qty = sum(entry.get('qty', 1) for entry in group_entries)
-        bom.append({**group_entries[0], 'qty': round(total_qty, 3), 'designators': sorted(set(designators))})
+    # add harness aditional components to bom as shallow copies, as they both are List[BOMEntry];
+    # copying keeps the in-place cleanup below from touching the entries stored on the harness
+    bom_entries.extend(dict(entry) for entry in harness.additional_bom_items)
+
+    # remove line breaks if present and cleanup any resulting whitespace issues;
+    # update entries in place - only string values can change, so rebuilding every dict is wasted work
+    for entry in bom_entries:
+        for k, v in entry.items():
+            if isinstance(v, str):
+                entry[k] = clean_whitespace(v)
+
+    # deduplicate bom by aggregating entries sharing a key in a single pass
+    bom_groups = {}
+    for entry in bom_entries:
+        key = bom_entry_key(entry)
+        group = bom_groups.get(key)
+        if group is None:
+            group = bom_groups[key] = _BomGroup(entry)
+        group.qty += entry.get('qty', 1)
+        group.designators.update(make_list(entry.get('designators')))
+    bom = [{**group.first_entry, 'qty': round(group.qty, 3), 'designators': sorted(group.designators)}
+           for _, group in sorted(bom_groups.items())]
 
     # add an incrementing id to each bom entry
     return [{**entry, 'id': index} for index, entry in enumerate(bom, 1)]
@@ -175,13 +196,14 @@ def component_table_entry(
               + (f' {unit}' if unit else '')
               + f' x {type}'
               + ('<br/>' if any(part_number_list) else '')
-              + (', '.join([pn for pn in part_number_list if pn])))
+              + (', '.join(pn for pn in part_number_list if pn)))
     # format the above output as left aligned text in a single visible cell
     # indent is set to two to match the indent in the generated html table
     return f'''<table border="0" cellspacing="0" cellpadding="3" cellborder="1"{html_bgcolor_attr(bgcolor)}><tr>
    <td align="left" balign="left">{html_line_breaks(output)}</td>
   </tr></table>'''
 
+@lru_cache(maxsize=None)  # the same part numbers recur across pins, wires and BOM entries
 def pn_info_string(header: str, name: Optional[str], number: Optional[str]) -> Optional[str]:
     """Return the company name and/or the part number in one single string or None otherwise."""
     number = str(number).strip() if number is not None else ''
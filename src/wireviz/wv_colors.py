@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 COLOR_CODES = {
     'DIN': ['WH', 'BN', 'GN', 'YE', 'GY', 'PK', 'BU', 'RD', 'BK', 'VT', 'GYPK', 'RDBU', 'WHGN', 'BNGN', 'WHYE', 'YEBN',
@@ -118,8 +119,13 @@ ColorScheme = str  # Color scheme name = Literal[COLOR_CODES.keys()]
 
 def get_color_hex(input: Colors, pad: bool = False) -> List[str]:
     """Return list of hex colors from either a string of color names or :-separated hex colors."""
+    # callers may concatenate or otherwise modify the result; hand out a fresh list over the cached tuple
+    return list(_get_color_hex(input, pad))
+
+@lru_cache(maxsize=None)  # the same few color strings are converted once per wire and per edge
+def _get_color_hex(input: Colors, pad: bool) -> Tuple[str, ...]:
     if input is None or input == '':
-        return [color_default]
+        return (color_default,)
     elif input[0] == '#':  # Hex color(s)
         output = input.split(':')
         for i, c in enumerate(output):
@@ -145,7 +151,13 @@ def get_color_hex(input: Colors, pad: bool = False) -> List[str]:
     elif pad and len(output) == 1:  # Hacky style fix: Give single color wires
         output *= 3                 # a triple-up so that wires are the same size.
 
-    return output
+    return tuple(output)
+
+
+@lru_cache(maxsize=None)  # wires sharing a color share one framed tuple instead of three fresh lists each
+def get_color_hex_framed(input: Colors, pad: bool = False) -> Tuple[str, ...]:
+    """Return hex colors framed by black on both sides, as drawn for wires and their edges."""
+    return ('#000000',) + _get_color_hex(input, pad) + ('#000000',)
 
 
 def get_color_translation(translate: Dict[Color, str], input: Colors) -> List[str]:
@@ -160,6 +172,7 @@ def get_color_translation(translate: Dict[Color, str], input: Colors) -> List[st
            [translate.get(input[i:i+2], '??') for i in range(0, len(input), 2)]
 
 
+@lru_cache(maxsize=None)  # pure string mapping, called repeatedly with the same arguments
 def translate_color(input: Colors, color_mode: ColorMode) -> str:
     if input == '' or input is None:
         return ''
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from typing import List
 import re
 
@@ -105,6 +106,7 @@ def open_file_write(filename):
 def open_file_append(filename):
     return open(filename, 'a', encoding='UTF-8')
 
+@lru_cache(maxsize=None)  # opening and decoding the same image for every use is wasteful
 def aspect_ratio(image_src):
     try:
         from PIL import Image